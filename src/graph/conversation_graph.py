@@ -1,38 +1,48 @@
 import re
+import string
 from uuid import UUID
 from difflib import SequenceMatcher
-from threading import RLock
-from typing import Dict, Set, Optional, List
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, Optional, List, Mapping
+from rapidfuzz import fuzz
 from src.graph.edge import Edge
 from src.graph.node import Node
-from src.util.singleton import singleton
+from src.graph.edge_view import EdgeView
 from src.llm.models.llm_message import LlmMessage
 
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_ASCII_NORMALIZE_TABLE = str.maketrans(
+    {c: None for c in map(chr, range(128)) if _PUNCT_RE.match(c)} |
+    {c: c.lower() for c in string.ascii_uppercase}
+)
+
 
-@singleton
 class ConversationGraph:
     def __init__(self, node_similarity_threshold: float = 0.60):
         self.__root_id: Optional[UUID] = None
         self.__nodes: Dict[UUID, Node] = {}
-        self.__edges: Set[Edge] = set()
+        self.__adjacency: Dict[UUID, Dict[UUID, Edge]] = {}
+        self.__normalized_decision_points: Dict[UUID, str] = {}
         self.__node_similarity_threshold = node_similarity_threshold
-        self.__lock = RLock()
+        self.__lock = Lock()
 
     @property
-    def nodes(self) -> Dict[UUID, Node]:
+    def nodes(self) -> Mapping[UUID, Node]:
         """
-        Returns a copy of the nodes in the graph.
-        :return: [Dict[UUID, Node]]
+        Returns a read-only live view of the nodes in the graph. Take list(graph.nodes.values()) for a snapshot
+        before iterating while the graph is being built.
+        :return: [Mapping[UUID, Node]]
         """
-        return self.__nodes.copy()
+        return MappingProxyType(self.__nodes)
 
     @property
-    def edges(self) -> Set[Edge]:
+    def edges(self) -> EdgeView:
         """
-        Returns a copy of the edges in the graph.
-        :return: [Set[Edge]]
+        Returns a read-only live view of the edges in the graph.
+        :return: [EdgeView]
         """
-        return self.__edges.copy()
+        return EdgeView(self.__adjacency)
 
     def add_node(self, node: Node) -> UUID:
         """
@@ -40,24 +50,25 @@ class ConversationGraph:
         :param node: node to add
         :return: UUID id of the node added or the similar node found
         """
+        normalized_decision_point = self.__normalize_text(node.decision_point)
         with self.__lock:
             if not self.__root_id:
                 if not node.is_initial:
                     raise ValueError("Graph must have INITIAL state")
                 self.__root_id = node.id
-                self.__nodes[node.id] = node
+                self.__insert_node(node, normalized_decision_point)
                 return node.id
 
             if node.is_terminal:
-                self.__nodes[node.id] = node
+                self.__insert_node(node, normalized_decision_point)
                 return node.id
 
             similar_node = self.__find_similar_node(
-                node.decision_point,
+                normalized_decision_point,
             )
 
             if not similar_node:
-                self.__nodes[node.id] = node
+                self.__insert_node(node, normalized_decision_point)
                 return node.id
 
             return similar_node.id
@@ -72,7 +83,7 @@ class ConversationGraph:
         with self.__lock:
             if edge.source_node_id not in self.__nodes or edge.target_node_id not in self.__nodes:
                 raise ValueError("Edge nodes must exist in graph")
-            self.__edges.add(edge)
+            self.__adjacency.setdefault(edge.source_node_id, {}).setdefault(edge.target_node_id, edge)
 
     def build_conversation_history(self, node_id: UUID) -> List[LlmMessage]:
         """
@@ -82,35 +93,40 @@ class ConversationGraph:
         :param node_id: id of the node to start building the conversation history from
         :return: [List[LlmMessage]] list of messages in chronological order
         """
-        with self.__lock:
-            messages: List[LlmMessage] = []
-            current_node_id = node_id
-
-            while current_node_id is not None:
-                current_node = self.__nodes[current_node_id]
-                messages.append(current_node.assistant_message)
-
-                if current_node.parent_id is not None:
-                    edge = next(
-                        edge for edge in self.__edges
-                        if edge.source_node_id == current_node.parent_id
-                        and edge.target_node_id == current_node_id
-                    )
-                    messages.append(edge.user_message)
-
-                current_node_id = current_node.parent_id
-
-            return list(reversed(messages))
-
-    def __find_similar_node(self, decision_point: str) -> Optional[Node]:
-        normalized_input = self.__normalize_text(decision_point)
-        for node in self.__nodes.values():
-            normalized_node = self.__normalize_text(node.decision_point)
-            similarity = SequenceMatcher(None, normalized_input, normalized_node).ratio()
+        # Lock-free: nodes and edges are only ever inserted, and a node's path is in the graph before it is walked
+        messages: List[LlmMessage] = []
+        current_node_id = node_id
+
+        while current_node_id is not None:
+            current_node = self.__nodes[current_node_id]
+            messages.append(current_node.assistant_message)
+
+            if current_node.parent_id is not None:
+                edge = self.__adjacency[current_node.parent_id][current_node_id]
+                messages.append(edge.user_message)
+
+            current_node_id = current_node.parent_id
+
+        return list(reversed(messages))
+
+    def __insert_node(self, node: Node, normalized_decision_point: str):
+        self.__nodes[node.id] = node
+        self.__normalized_decision_points[node.id] = normalized_decision_point
+
+    def __find_similar_node(self, normalized_decision_point: str) -> Optional[Node]:
+        score_cutoff = self.__node_similarity_threshold * 100
+        for node_id, normalized_node in self.__normalized_decision_points.items():
+            # fuzz.ratio never scores below SequenceMatcher.ratio, so it can only rule a node out; SequenceMatcher
+            # still decides, as fuzz.ratio alone merges transcripts that share a greeting but end on different questions
+            if not fuzz.ratio(normalized_decision_point, normalized_node, score_cutoff=score_cutoff):
+                continue
+            similarity = SequenceMatcher(None, normalized_decision_point, normalized_node).ratio()
             if similarity >= self.__node_similarity_threshold:
-                return node
+                return self.__nodes[node_id]
         return None
 
     @staticmethod
     def __normalize_text(text: str) -> str:
-        return ' '.join((re.sub(r'[^\w\s]', '', text)).lower().split())
+        if text.isascii():
+            return ' '.join(text.translate(_ASCII_NORMALIZE_TABLE).split())
+        return ' '.join(_PUNCT_RE.sub('', text).lower().split())
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from src.llm.models.llm_message import LlmMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     source_node_id: UUID
     target_node_id: UUID
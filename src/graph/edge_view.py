@@ -0,0 +1,25 @@
+from uuid import UUID
+from typing import Collection, Iterator, Mapping
+from src.graph.edge import Edge
+
+
+class EdgeView(Collection[Edge]):
+    """
+    Read-only live view over the edges of a ConversationGraph; edges added to the graph later show up in the view.
+    Iterating never fails on concurrent additions; use list(view) for a stable snapshot.
+    """
+
+    def __init__(self, adjacency: Mapping[UUID, Mapping[UUID, Edge]]):
+        self.__adjacency = adjacency
+
+    def __iter__(self) -> Iterator[Edge]:
+        for targets in list(self.__adjacency.values()):
+            yield from list(targets.values())
+
+    def __len__(self) -> int:
+        return sum(len(targets) for targets in list(self.__adjacency.values()))
+
+    def __contains__(self, edge: object) -> bool:
+        if not isinstance(edge, Edge):
+            return False
+        return edge.target_node_id in self.__adjacency.get(edge.source_node_id, {})
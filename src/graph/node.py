@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from src.llm.models.llm_message import LlmMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     id: UUID
     decision_point: str
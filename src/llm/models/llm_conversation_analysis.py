@@ -2,7 +2,7 @@ from typing import Optional, List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LlmConversationAnalysis:
     """
     Represents the analysis of a conversation
@@ -2,7 +2,7 @@ from typing import Literal
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LlmMessage:
     """
     Represents a message so it can be passed in the payload of request to LLM as conversation history
@@ -10,7 +10,8 @@ class LlmResponseService(ABC):
             role: str,
             prompt: str,
             conversation_history: Optional[List[LlmMessage]],
-            timeout: Optional[int] = None
+            timeout: Optional[int] = None,
+            instructions: Optional[str] = None
     ) -> str:
         """
         This method is used as a baseline behavior for all LLM Response Services
@@ -19,6 +20,8 @@ class LlmResponseService(ABC):
         :param prompt: The task for the model to complete
         :param conversation_history: The conversation history to provide context for the model
         :param timeout: Amount of seconds to wait before throwing requests.exceptions.Timeout
+        :param instructions: Static task instructions placed ahead of the conversation history so they stay part of
+                             the cacheable prompt prefix, the prompt then only needs to carry per-call information
         :return: response from LLM
         :rtype: str
         :exception: requests.exceptions.Timeout
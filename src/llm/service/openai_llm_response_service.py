@@ -1,5 +1,8 @@
+import orjson
 import requests
 from typing import override, Optional, List
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 from src.util.env import Env
 from src.llm.models.llm_message import LlmMessage
 from src.llm.service.llm_response_service import LlmResponseService
@@ -10,10 +13,20 @@ class OpenAILlmResponseService(LlmResponseService):
         self.__model = model
         self.__url = "https://api.openai.com/v1/chat/completions"
         self.__api_key = Env()["OPENAI_API_KEY"]
-        self.__headers = {
+        self.__session = requests.Session()
+        self.__session.headers.update({
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.__api_key}",
-        }
+        })
+        # Completions have no side effects, so rate limits and 5xx are retried; read timeouts still surface
+        self.__session.mount("https://", HTTPAdapter(max_retries=Retry(
+            total=2,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+            raise_on_status=False
+        )))
 
     @property
     def model(self) -> str:
@@ -24,7 +37,8 @@ class OpenAILlmResponseService(LlmResponseService):
             self,
             role: str, prompt: str,
             conversation_history: Optional[List[LlmMessage]],
-            timeout: Optional[int] = None
+            timeout: Optional[int] = None,
+            instructions: Optional[str] = None
     ) -> str:
         payload = {
             "model": self.__model,
@@ -33,6 +47,12 @@ class OpenAILlmResponseService(LlmResponseService):
                     "role": "system",
                     "content": role
                 },
+                *(
+                    [{
+                        "role": "system",
+                        "content": instructions
+                    }] if instructions else []
+                ),
                 *[
                     {
                         "role": m.role,
@@ -47,17 +67,16 @@ class OpenAILlmResponseService(LlmResponseService):
         }
 
         try:
-            response = requests.post(
+            response = self.__session.post(
                 url=self.__url,
-                headers=self.__headers,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=timeout
             )
         except requests.exceptions.Timeout:
             raise TimeoutError("OpenAI must be down or increase timeout duration")
 
-        response_data = response.json()
         try:
-            return response_data["choices"][0]["message"]["content"]
-        except (KeyError, IndexError):
+            return orjson.loads(response.content)["choices"][0]["message"]["content"]
+        except (orjson.JSONDecodeError, KeyError, IndexError):
             raise ValueError("No content found in the response")
+
@@ -16,8 +16,9 @@ class ApplicationServer:
     Server configuration and initialization for the Flask application.
     """
 
-    def __init__(self, host='0.0.0.0', port=8000):
+    def __init__(self, conversation_graph: ConversationGraph, host='0.0.0.0', port=8000):
         self.__app = Flask(__name__)
+        self.__conversation_graph = conversation_graph
         self.__host = host
         self.__port = port
         self.__configure_app()
@@ -25,7 +26,7 @@ class ApplicationServer:
     def __configure_app(self):
         """Configure Flask application with middleware and routes"""
         CORS(self.__app)
-        register_graph_routes(self.__app)
+        register_graph_routes(self.__app, self.__conversation_graph)
 
     def run(self):
         """Start the Flask server"""
@@ -43,7 +44,8 @@ def main():
     setup_logging()
     logger = logging.getLogger(__name__)
     logger.info("Starting application...")
-    server = ApplicationServer()
+    conversation_graph = ConversationGraph(node_similarity_threshold=0.9)
+    server = ApplicationServer(conversation_graph)
     server.run()
 
     logger.info("Initializing discovery service...")
@@ -53,7 +55,7 @@ def main():
         llm_service=OpenAILlmResponseService(),
         transcription_service=DeepgramTranscribeService(),
         hamming_api_client=HammingVoiceApiClient(),
-        conversation_graph=ConversationGraph(node_similarity_threshold=0.9),
+        conversation_graph=conversation_graph,
         max_depth=5
     )
 
@@ -2,7 +2,7 @@ from flask import jsonify
 from src.graph.conversation_graph import ConversationGraph
 
 
-def register_graph_routes(app):
+def register_graph_routes(app, graph: ConversationGraph):
     """Register all graph-related routes with the Flask application"""
 
     @app.route('/v1/conversation-graph', methods=['GET'])
@@ -11,7 +11,6 @@ def register_graph_routes(app):
         Get the current conversation graph as a JSON object
         :return: JSON representation of the conversation graph
         """
-        graph = ConversationGraph()
         return jsonify({
             'nodes': [
                 {
@@ -20,7 +19,7 @@ def register_graph_routes(app):
                     'is_terminal': node.is_terminal,
                     'decision_point': node.decision_point
                 }
-                for node in graph.nodes.values()
+                for node in list(graph.nodes.values())
             ],
             'edges': [
                 {
@@ -1,14 +1,21 @@
 import ngrok
 import requests
 from typing import Optional
-from datetime import datetime
-from queue import Queue, Empty
+from queue import SimpleQueue, Empty
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 from src.util.env import Env
 from src.rest.webhook.webhook_callback import WebhookCallback
 from src.rest.webhook.hamming_webhook_server import start_webhook_server
 from src.rest.dto.hamming_call_request_dto import HammingCallRequestDTO
 from src.rest.dto.hamming_call_response_dto import HammingCallResponseDTO
 
+# Backoff shared by every retried request; a Retry-After header on 429 takes precedence over it
+_RETRY_DEFAULTS = {
+    "total": 4,
+    "backoff_factor": 0.5,
+    "raise_on_status": False
+}
 
 class HammingVoiceApiError(Exception):
     """Custom exception for Voice API errors"""
@@ -28,10 +35,26 @@ class HammingVoiceApiClient:
     def __init__(self):
         self.__base_url = "https://app.hamming.ai/api".rstrip('/')
         self.__api_key = Env()["HAMMING_API_KEY"]
-        self.__headers = {
+        self.__session = requests.Session()
+        self.__session.headers.update({
             "Authorization": f"Bearer {self.__api_key}",
             "Content-Type": "application/json"
-        }
+        })
+        # Only GETs are retried; re-sending start-call could place a duplicate phone call
+        self.__session.mount("https://", HTTPAdapter(max_retries=Retry(
+            **_RETRY_DEFAULTS,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"]
+        )))
+        # A 429 means start-call was rejected before any call was placed, so that status alone is safe to re-send
+        self.__start_call_url = f"{self.__base_url}/rest/exercise/start-call"
+        self.__session.mount(self.__start_call_url, HTTPAdapter(max_retries=Retry(
+            **_RETRY_DEFAULTS,
+            read=False,
+            other=0,
+            status_forcelist=[429],
+            allowed_methods=["POST"]
+        )))
         self.__callback = WebhookCallback()
 
         start_webhook_server()
@@ -56,7 +79,7 @@ class HammingVoiceApiClient:
         :raises VoiceApiError: If API call fails
         """
         try:
-            callback_queue = Queue()
+            callback_queue = SimpleQueue()
 
             request = HammingCallRequestDTO(
                 phone_number=phone_number,
@@ -64,22 +87,23 @@ class HammingVoiceApiClient:
                 webhook_url=self.__webhook_url
             )
 
-            with self.__callback.callback_lock:
-                response = requests.post(
-                    f"{self.__base_url}/rest/exercise/start-call",
-                    headers=self.__headers,
-                    json=request.__dict__,
-                    timeout=30
-                )
+            response = self.__session.post(
+                self.__start_call_url,
+                json=request.__dict__,
+                timeout=30
+            )
 
-                if response.status_code != 200:
-                    raise HammingVoiceApiError(
-                        f"Failed to start call: {response.text}",
-                        response.status_code
-                    )
+            if response.status_code != 200:
+                raise HammingVoiceApiError(
+                    f"Failed to start call: {response.text}",
+                    response.status_code
+                )
 
-                data = response.json()
-                call_id = data["id"]
+            data = response.json()
+            call_id = data["id"]
+            # The webhook only fires once the call has ended, long after start-call returns, so registering
+            # here (rather than holding the lock across the request and its retries) can't miss the recording
+            with self.__callback.callback_lock:
                 self.__callback.callbacks[call_id] = callback_queue
 
             return HammingCallResponseDTO(id=call_id)
@@ -91,7 +115,7 @@ class HammingVoiceApiClient:
         self,
         call_id: str,
         timeout: int = 300
-    ) -> str:
+    ) -> bytes:
         """
         Get recording for completed call.
 
@@ -99,8 +123,8 @@ class HammingVoiceApiClient:
         :type call_id: str
         :param timeout: Max seconds to wait for recording
         :type timeout: int
-        :returns: Path to downloaded recording file
-        :rtype: str
+        :returns: Audio content of the recording
+        :rtype: bytes
         :raises VoiceApiError: If recording retrieval fails or times out
         """
         try:
@@ -123,9 +147,8 @@ class HammingVoiceApiClient:
                         del self.__callback.callbacks[call_id]
 
             # Get recording
-            response = requests.get(
+            response = self.__session.get(
                 f"{self.__base_url}/media/exercise",
-                headers=self.__headers,
                 params={"id": call_id},
                 timeout=30
             )
@@ -136,13 +159,7 @@ class HammingVoiceApiClient:
                     response.status_code
                 )
 
-            # Save recording
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_path = f"/tmp/recording_{call_id}_{timestamp}.wav"
-            with open(file_path, "wb") as f:
-                f.write(response.content)
-
-            return file_path
+            return response.content
 
         except requests.RequestException as e:
             raise HammingVoiceApiError(f"Failed to get recording: {str(e)}")
@@ -2,6 +2,8 @@ import re
 import logging
 from uuid import UUID, uuid4
 from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from src.graph.edge import Edge
 from src.graph.node import Node
 from src.graph.conversation_graph import ConversationGraph
@@ -15,6 +17,42 @@ from src.rest.dto.hamming_call_response_dto import HammingCallResponseDTO
 from src.speech.service.speech_transcribe_service import SpeechTranscribeService
 from src.util.logging_config import setup_logging
 
+_TRANSFER_PATTERNS = [
+    r"transferring to an agent"
+    r"transfer(?:ring|red)?\s+(?:you|your\s+call)"
+]
+
+_CALLBACK_PATTERNS = [
+    r"call\s*(?:you\s*)?back",
+    r"return\s*(?:your\s*)?call",
+    r"(?:will|can|shall)\s+call\s+(?:you\s+)?back"
+    r"contact you",
+]
+
+_UNAVAILABLE_PATTERNS = [
+    r"cannot help",
+    r"can't help",
+    r"unable to assist",
+    r"not able to help",
+    r"(?:cannot|can\'t|unable\s+to)\s+(?:help|assist)"
+]
+
+_CLOSING_PATTERNS = [
+    r"(?:appointment|service) (?:is )?confirm(?:ed)?",
+]
+
+_TERMINAL_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})" for pattern in (
+            _TRANSFER_PATTERNS +
+            _CALLBACK_PATTERNS +
+            _UNAVAILABLE_PATTERNS +
+            _CLOSING_PATTERNS
+        )
+    ),
+    re.IGNORECASE
+)
+
 
 class DiscoveryService:
     def __init__(
@@ -25,7 +63,8 @@ class DiscoveryService:
             llm_service: LlmResponseService,
             transcription_service: SpeechTranscribeService,
             conversation_graph: ConversationGraph,
-            max_depth: Optional[int] = None
+            max_depth: Optional[int] = None,
+            max_parallel_prompts: int = 4
     ):
         setup_logging()
         self.logger = logging.getLogger(__name__)
@@ -41,6 +80,7 @@ class DiscoveryService:
         self.__transcription_service = transcription_service
         self.__graph: ConversationGraph = conversation_graph
         self.__max_depth = max_depth
+        self.__max_parallel_prompts = max_parallel_prompts
 
     def discover(self):
         """
@@ -71,10 +111,19 @@ class DiscoveryService:
         self.logger.debug("Added root node to graph")
 
         self.logger.info("Starting node exploration...")
-        self.__explore_node(root_node)
+        with ThreadPoolExecutor(
+                max_workers=self.__max_parallel_prompts,
+                thread_name_prefix="response-prompt"
+        ) as prompt_executor:
+            try:
+                self.__explore_node(root_node, prompt_executor)
+            except BaseException:
+                # Drop queued sibling prompts so the failure (or Ctrl-C) isn't held up until they all finish
+                prompt_executor.shutdown(cancel_futures=True)
+                raise
         self.logger.info("Discovery process completed")
 
-    def __explore_node(self, curr_node: Node):
+    def __explore_node(self, curr_node: Node, prompt_executor: ThreadPoolExecutor):
         self.logger.info(f"Exploring node {curr_node.id} at depth {curr_node.depth}")
 
         if self.__max_depth and curr_node.depth >= self.__max_depth:
@@ -104,17 +153,27 @@ class DiscoveryService:
             self.__graph.add_edge(edge)
             return
 
-        self.logger.debug(f"Generated {len(analysis.possible_responses)} possible responses")
-        for idx, response in enumerate(analysis.possible_responses, 1):
-            self.logger.info(f"Processing response {idx}/{len(analysis.possible_responses)}")
+        responses = analysis.possible_responses
+        self.logger.debug(f"Generated {len(responses)} possible responses")
+        # Sibling prompts only depend on curr_node's history, so generate them while calls run. Only a window of
+        # max_parallel_prompts is queued ahead, so a child's prompts never wait behind all of its parent's siblings
+        prompt_futures = deque(
+            prompt_executor.submit(self.__generate_response_prompt, curr_node.id, response)
+            for response in responses[:self.__max_parallel_prompts]
+        )
+        for idx, response in enumerate(responses, 1):
+            self.logger.info(f"Processing response {idx}/{len(responses)}")
             self.logger.debug(f"Response: {response}")
 
-            prompt = self.__generate_response_prompt(
-                curr_node.id,
-                response
-            )
+            prompt = prompt_futures.popleft().result()
             self.logger.debug(f"Generated response prompt: {prompt}")
 
+            next_idx = idx - 1 + self.__max_parallel_prompts
+            if next_idx < len(responses):
+                prompt_futures.append(
+                    prompt_executor.submit(self.__generate_response_prompt, curr_node.id, responses[next_idx])
+                )
+
             self.logger.info("Making call to agent...")
             transcription = self.__make_call(prompt)
             self.logger.debug(f"Received transcription: {transcription}")
@@ -140,52 +199,19 @@ class DiscoveryService:
 
             if node_id == new_node.id:
                 self.logger.info("Node is new, continuing exploration")
-                self.__explore_node(new_node)
+                self.__explore_node(new_node, prompt_executor)
             else:
                 self.logger.info("Node already exists, skipping further exploration")
 
     def __analyze_conversation_state(self, node_id: UUID, agent_response: str) -> LlmConversationAnalysis:
         self.logger.info("Analyzing conversation state")
-        normalized_response = agent_response.lower().strip()
-
-        transfer_patterns = [
-            r"transferring to an agent"
-            r"transfer(?:ring|red)?\s+(?:you|your\s+call)"
-        ]
-
-        callback_patterns = [
-            r"call\s*(?:you\s*)?back",
-            r"return\s*(?:your\s*)?call",
-            r"(?:will|can|shall)\s+call\s+(?:you\s+)?back"
-            r"contact you",
-        ]
-
-        unavailable_patterns = [
-            r"cannot help",
-            r"can't help",
-            r"unable to assist",
-            r"not able to help",
-            r"(?:cannot|can\'t|unable\s+to)\s+(?:help|assist)"
-        ]
-
-        closing_patterns = [
-            r"(?:appointment|service) (?:is )?confirm(?:ed)?",
-        ]
-
-        terminal_patterns = (
-                transfer_patterns +
-                callback_patterns +
-                unavailable_patterns +
-                closing_patterns
-        )
-
-        for pattern in terminal_patterns:
-            if re.search(pattern, normalized_response, re.IGNORECASE):
-                self.logger.debug(f"Terminal pattern matched: {pattern}")
-                return LlmConversationAnalysis(
-                    is_terminal=True,
-                    possible_responses=None
-                )
+        terminal_match = _TERMINAL_RE.search(agent_response)
+        if terminal_match:
+            self.logger.debug(f"Terminal pattern matched: {terminal_match.group(0)}")
+            return LlmConversationAnalysis(
+                is_terminal=True,
+                possible_responses=None
+            )
         self.logger.debug("No terminal pattern matched, proceeding with LLM analysis")
 
         history = self.__graph.build_conversation_history(node_id)
@@ -197,7 +223,8 @@ class DiscoveryService:
         response = self.__llm_service.response(
             role=ANALYSIS_ROLE,
             prompt=contextualized_prompt,
-            conversation_history=history
+            conversation_history=history,
+            instructions=LlmTemplate.transcription_analysis_instructions()
         )
 
         try:
@@ -233,7 +260,8 @@ class DiscoveryService:
         return self.__llm_service.response(
             role=CUSTOMER_ROLE,
             prompt=contextualized_prompt,
-            conversation_history=history
+            conversation_history=history,
+            instructions=LlmTemplate.response_customer_instructions(self.__business_type)
         )
 
     def __make_call(self, prompt: str) -> str:
@@ -247,11 +275,11 @@ class DiscoveryService:
         self.logger.debug(f"Call started with ID: {call_response.id}")
 
         self.logger.debug("Getting recording...")
-        recording_path = self.__hamming_api_client.get_recording(call_response.id)
-        self.logger.debug(f"Recording saved at: {recording_path}")
+        recording = self.__hamming_api_client.get_recording(call_response.id)
+        self.logger.debug(f"Recording downloaded ({len(recording)} bytes)")
 
         self.logger.debug("Transcribing recording...")
-        transcription = self.__transcription_service.transcribe(recording_path)
+        transcription = self.__transcription_service.transcribe(recording)
         self.logger.debug(f"Transcription complete")
 
         if not transcription.strip():
@@ -10,7 +10,7 @@ class DeepgramTranscribeService(SpeechTranscribeService):
         self.__dg = Deepgram(self.__api_key)
 
     @override
-    def transcribe(self, audio_file_path: str) -> str:
+    def transcribe(self, audio: bytes) -> str:
         mime_type = 'audio/wav'
 
         options = {
@@ -19,9 +19,8 @@ class DeepgramTranscribeService(SpeechTranscribeService):
             'tier': 'enhanced'
         }
 
-        with open(audio_file_path, 'rb') as f:
-            _audio_ = {"buffer": f, "mimetype": mime_type}
-            response = self.__dg.transcription.sync_prerecorded(_audio_, options)
+        _audio_ = {"buffer": audio, "mimetype": mime_type}
+        response = self.__dg.transcription.sync_prerecorded(_audio_, options)
 
         try:
             return response['results']['channels'][0]['alternatives'][0]['transcript']